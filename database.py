@@ -5,6 +5,12 @@ It provides methods to fetch an NEO by designation or by name, as well
 as a method to query the set of close approaches that match a collection of
 user-specified criteria.
 """
+import bisect
+import collections
+import itertools
+import operator
+
+from filters import DateFilter, DiameterFilter, HazardousFilter
 
 
 class NEODatabase:
@@ -22,20 +28,35 @@ class NEODatabase:
         :param neos: A collection of `NearEarthObject`s.
         :param approaches: A collection of `CloseApproach`es.
         """
-        self._neos = neos
-        self._approaches = approaches
-        self._designation_to_neo = {}
-        self._name_to_neo = {}
-
-        for neo in self._neos:
-            self._designation_to_neo[neo.designation.lower()] = neo
-            if neo.name is not None:
-                self._name_to_neo[neo.name.lower()] = neo
-
-        for app in self._approaches:
-            neo = self._designation_to_neo[app.designation.lower()]
-            app.neo = self._designation_to_neo[app.designation.lower()]
+        self._neos = list(neos)
+        self._approaches = list(approaches)
+        self._designation_to_neo = {
+            neo._designation_lc: neo for neo in self._neos
+        }
+        self._name_to_neo = {
+            neo.name.lower(): neo for neo in self._neos
+            if neo.name is not None
+        }
+
+        designation_to_neo = self._designation_to_neo
+        by_date = collections.defaultdict(list)
+        # Whether walking the dates in order also walks the input in order.
+        input_by_date = True
+        previous = None
+        for i, app in enumerate(self._approaches):
+            neo = designation_to_neo[app.designation.lower()]
+            app.neo = neo
             neo.approaches.append(app)
+            date_ord = app._date_ord
+            by_date[date_ord].append(i)
+            if previous is not None and date_ord < previous:
+                input_by_date = False
+            previous = date_ord
+
+        # Positions of the approaches on each date, in input order.
+        self._by_date = dict(by_date)
+        self._dates = sorted(self._by_date)
+        self._input_by_date = input_by_date
 
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its designation.
@@ -43,12 +64,7 @@ class NEODatabase:
         :param designation: The primary designation of the NEO.
         :return: The `NEO` with the desired designation, or `None`.
         """
-        designation = designation.lower()
-        neo = self._designation_to_neo.get(designation)
-
-        if neo is None:
-            return None
-        return neo
+        return self._designation_to_neo.get(designation.lower())
 
     def get_neo_by_name(self, name):
         """Find and return an NEO by its name.
@@ -56,31 +72,64 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
-        name = name.lower()
-        neo = self._name_to_neo.get(name)
-
-        if neo is None:
-            return None
-        return neo
+        return self._name_to_neo.get(name.lower())
 
     def query(self, filters=()):
         """Query close approaches to match a collection of filters.
 
         This generates a stream of `CloseApproach` objects that match
-        all of the provided filters.
+        all of the provided filters, in the order the approaches were given
+        to the database.
 
         If no arguments are provided, generate all known close approaches.
 
         :param filters: A collection of filters.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for approach in self._approaches:
+        approaches, filters = self._narrow_by_date(filters)
+        # Check the approach's own attributes before following its `neo`.
+        filters.sort(key=lambda a_filter: isinstance(
+            a_filter, (DiameterFilter, HazardousFilter)))
+        for approach in approaches:
+            if all(a_filter(approach) for a_filter in filters):
+                yield approach
 
-            semaphor = True
-            for a_filter in filters:
-                if not a_filter(approach):
-                    semaphor = False
-                    break
+    def _narrow_by_date(self, filters):
+        """Use the date index to pick the close approaches worth filtering.
 
-            if semaphor:
-                yield approach
+        Date filters comparing with `eq`, `ge` or `le` are folded into a
+        single inclusive date range, which is looked up in the sorted date
+        index of date ordinals. All other filters are left to be evaluated
+        per approach.
+
+        :param filters: A collection of filters.
+        :return: A tuple of candidate `CloseApproach`es and remaining filters.
+        """
+        start = end = None
+        remaining = []
+
+        for a_filter in filters:
+            if isinstance(a_filter, DateFilter):
+                if a_filter.op in (operator.eq, operator.ge):
+                    if start is None or a_filter.value > start:
+                        start = a_filter.value
+                if a_filter.op in (operator.eq, operator.le):
+                    if end is None or a_filter.value < end:
+                        end = a_filter.value
+                if a_filter.op in (operator.eq, operator.ge, operator.le):
+                    continue
+            remaining.append(a_filter)
+
+        if start is None and end is None:
+            return self._approaches, remaining
+
+        lo = 0 if start is None else bisect.bisect_left(self._dates, start)
+        hi = len(self._dates) if end is None \
+            else bisect.bisect_right(self._dates, end)
+        positions = itertools.chain.from_iterable(
+            self._by_date[date_ord] for date_ord in self._dates[lo:hi]
+        )
+        if not self._input_by_date:
+            positions = sorted(positions)
+        approaches = map(self._approaches.__getitem__, positions)
+        return approaches, remaining
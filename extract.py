@@ -14,10 +14,15 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+import operator
 
 from models import NearEarthObject, CloseApproach
 
 
+_NAN = float('nan')
+_HAZARDOUS = {'Y': True, 'y': True}
+
+
 def load_neos(neo_csv_path):
     """Read near-Earth object information from a CSV file.
 
@@ -26,62 +31,26 @@ def load_neos(neo_csv_path):
     """
     neos = []
 
-    csv_fields = {
-        "designation": 3,
-        "name": 4,
-        "diameter": 15,
-        "hazardous": 7
-    }
-
-    def _is_empty(field):
-        """Check if the given field is None or empty string.
-
-        param: field (str) : value to check.
-        returns: bool value.
-        """
-        return False if field is None or field != '' else True
-
-    def _normalize_diameter(diameter):
-        """Check if the given field is a float attribute.
-
-        param: diameter (str) : value to check.
-        returns: float or 'nan'.
-        """
-        try:
-            return float(diameter)
-        except ValueError:
-            return 'nan'
-
-    def _normalize_hazardous(hazardous):
-        """Convert enum Y/N to bool value.
-
-        param: hazardous (str) : value to check.
-        returns: bool.
-        """
-        if hazardous.upper() == 'Y':
-            return True
-        return False
+    # Columns: pdes, name, diameter, pha.
+    neo_fields = operator.itemgetter(3, 4, 15, 7)
 
     with open(neo_csv_path, 'r', encoding='utf-8') as file:
         reader = csv.reader(file)
+        next(reader, None)
 
-        for i, row in enumerate(reader):
-            if i:
-
-                des = row[csv_fields["designation"]]
-                if _is_empty(des):
-                    continue
+        for des, name, diam, haz in map(neo_fields, reader):
+            if not des:
+                continue
 
-                if row[csv_fields["name"]] == '':
-                    name = None
-                else:
-                    name = row[csv_fields["name"]]
+            name = name or None
+            try:
+                diam = float(diam) if diam else _NAN
+            except ValueError:
+                diam = _NAN
+            haz = _HAZARDOUS.get(haz, False)
+            neo = NearEarthObject(des, name, diam, haz)
 
-                diam = _normalize_diameter(row[csv_fields["diameter"]])
-                haz = _normalize_hazardous(row[csv_fields["hazardous"]])
-                neo = NearEarthObject(des, name, diam, haz)
-
-                neos.append(neo)
+            neos.append(neo)
 
     return neos
 
@@ -102,15 +71,19 @@ def load_approaches(cad_json_path):
     close_approaches = []
 
     with open(cad_json_path, 'r', encoding='utf-8') as file:
-        reader = json.load(file)
-
-        for app in reader['data']:
-
-            des = app[app_vals["designation"]].strip()
-            time = app[app_vals["time"]]
-            distance = app[app_vals["distance"]].strip()
-            velocity = app[app_vals["velocity"]].strip()
-            close_app = CloseApproach(des, time, distance, velocity)
-            close_approaches.append(close_app)
+        data = json.load(file)['data']
+
+    # Pop the raw records as they are converted, so each one is released
+    # once its `CloseApproach` exists, rather than all at the very end.
+    data.reverse()
+    while data:
+        app = data.pop()
+
+        des = app[app_vals["designation"]].strip()
+        time = app[app_vals["time"]]
+        distance = app[app_vals["distance"]].strip()
+        velocity = app[app_vals["velocity"]].strip()
+        close_app = CloseApproach(des, time, distance, velocity)
+        close_approaches.append(close_app)
 
     return close_approaches
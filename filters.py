@@ -40,6 +40,9 @@ class AttributeFilter:
 
     Concrete subclasses can override the `get` classmethod to provide custom
     behavior to fetch a desired attribute from the given `CloseApproach`.
+    Subclasses reading a plain (possibly dotted) attribute bind `get` to an
+    `operator.attrgetter` instead, so fetching the attribute doesn't cost a
+    Python-level call per approach.
     """
 
     def __init__(self, op, value):
@@ -80,68 +83,51 @@ class AttributeFilter:
 
 
 class DateFilter(AttributeFilter):
-    """Specific class for date filters."""
+    """Specific class for date filters.
 
-    @classmethod
-    def get(cls, approach):
-        """Get a date value from a close approach.
+    Dates are compared as proleptic Gregorian ordinals (`date.toordinal()`),
+    so the reference `datetime.date` is stored as an `int` in `value`.
+    """
 
-        param: A `CloseApproach` on which to evaluate this filter.
-        return: datetime.date. Date of the close approach.
+    def __init__(self, op, value):
+        """Construct a new `DateFilter`.
+
+        :param op: A 2-argument predicate comparator (such as `operator.le`).
+        :param value: The reference `datetime.date` to compare against.
         """
-        return approach.time.date()
+        super().__init__(op, value.toordinal())
+        self.date = value
+
+    get = staticmethod(operator.attrgetter('_date_ord'))
+
+    def __repr__(self):
+        """Return string representation of `DateFilter` class."""
+        return f"{self.__class__.__name__}(op=operator.{self.op.__name__}, " \
+               f"value={self.date})"
 
 
 class DistanceFilter(AttributeFilter):
     """Specific class for distances filters."""
 
-    @classmethod
-    def get(cls, approach):
-        """Get a distance value from a close approach.
-
-        param: A `CloseApproach` on which to evaluate this filter.
-        return: float. Distance of a close approach.
-        """
-        return approach.distance
+    get = staticmethod(operator.attrgetter('distance'))
 
 
 class VelocityFilter(AttributeFilter):
     """Specific class for vwlocity filters."""
 
-    @classmethod
-    def get(cls, approach):
-        """Get a velocity value from a close approach.
-
-        param: A `CloseApproach` on which to evaluate this filter.
-        return: float. Velocity of a close approach
-        """
-        return approach.velocity
+    get = staticmethod(operator.attrgetter('velocity'))
 
 
 class DiameterFilter(AttributeFilter):
     """Specific class for diameters filters."""
 
-    @classmethod
-    def get(cls, approach):
-        """Get a diameter value from a close approach.
-
-        param: A `CloseApproach` on which to evaluate this filter.
-        return: float. Diameter of a close approach
-        """
-        return approach.neo.diameter
+    get = staticmethod(operator.attrgetter('neo.diameter'))
 
 
 class HazardousFilter(AttributeFilter):
     """Specific class for date hazardous."""
 
-    @classmethod
-    def get(cls, approach):
-        """Get a hazardous value from a close approach.
-
-        param: A `CloseApproach` on which to evaluate this filter.
-        return: bool. Is the close approach validated as hazardous.
-        """
-        return approach.neo.hazardous
+    get = staticmethod(operator.attrgetter('neo.hazardous'))
 
 
 def create_filters(
@@ -209,7 +195,4 @@ def limit(iterator, n=None):
     :param n: The maximum number of values to produce.
     :yield: The first (at most) `n` values from the iterator.
     """
-    if n is None or n == 0:
-        return iterator
-
-    return itertools.islice(iterator, n)
+    return itertools.islice(iterator, n or None)
@@ -33,6 +33,9 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches',
+                 '_designation_lc')
+
     def __init__(self, designation, name=None, diameter=None, hazardous=False):
         """Create a new `NearEarthObject`.
 
@@ -45,12 +48,11 @@ class NearEarthObject:
         assert self.designation is not None and self.designation != '', \
             f"Attribute designation is required. " \
             f"Value: '{designation}' is not allowed"
+        # Lowercased once, for case-insensitive lookups by designation.
+        self._designation_lc = designation.lower()
         self.name = None if name is None else name
-        if math.isnan(float(diameter)):
-            self.diameter = float('nan')
-        else:
-            self.diameter = float(diameter)
-        assert self.diameter > float(0) or math.isnan(float(diameter))
+        self.diameter = float(diameter)
+        assert self.diameter > float(0) or math.isnan(self.diameter)
         self.hazardous = False if not hazardous else bool(hazardous)
         self.approaches = []
 
@@ -98,6 +100,9 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'time', 'distance', 'velocity', 'neo',
+                 '_date_ord')
+
     def __init__(self, designation, time, distance, velocity):
         """Create a new `CloseApproach`.
 
@@ -113,20 +118,12 @@ class CloseApproach:
             f"'{designation}' is not allowed"
 
         self.time = cd_to_datetime(time)
+        # Proleptic Gregorian ordinal of the approach date, for date filters.
+        self._date_ord = self.time.toordinal()
         self.distance = float(distance)
         self.velocity = float(velocity)
         self.neo = None
 
-    @property
-    def neo(self):
-        """Attribute for the referenced NEO, originally None."""
-        return self.__neo
-
-    @neo.setter
-    def neo(self, neo):
-        """Attribute for the referenced NEO, originally None."""
-        self.__neo = neo
-
     @property
     def time_str(self):
         """Return a formatted representation of this approach time."""
@@ -11,9 +11,11 @@ To run these tests from the project root, run:
 These tests should pass when Task 2 is complete.
 """
 import collections.abc
+import csv
 import datetime
 import pathlib
 import math
+import tempfile
 import unittest
 
 from extract import load_neos, load_approaches
@@ -78,6 +80,28 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.hazardous, True)
 
 
+class TestLoadNEOsWithQuirks(unittest.TestCase):
+    def test_non_numeric_diameter_is_nan(self):
+        with TEST_NEO_FILE.open(encoding='utf-8') as file:
+            header = next(csv.reader(file))
+        row = [''] * len(header)
+        row[header.index('pdes')] = '2020 ABC'
+        row[header.index('pha')] = 'N'
+        row[header.index('diameter')] = 'abc'
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / 'neos.csv'
+            with path.open('w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                writer.writerow(row)
+            neos = load_neos(path)
+
+        self.assertEqual(len(neos), 1)
+        self.assertEqual(neos[0].designation, '2020 ABC')
+        self.assertTrue(math.isnan(neos[0].diameter))
+
+
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -0,0 +1,42 @@
+"""Check that NASA's calendar dates are converted to and from datetimes.
+
+The `cd_to_datetime` function parses the `cd` field of close approach data
+without `strptime` for speed, so these tests check that it agrees with
+`strptime` on well-formed dates and still rejects malformed ones.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+CD_FORMAT = "%Y-%b-%d %H:%M"
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def test_cd_to_datetime_matches_strptime(self):
+        for cd in ('1900-Jan-01 00:00', '2020-Feb-29 12:34', '2020-Dec-31 12:00',
+                   '2199-Sep-09 23:59', '2020-Jan-1 00:00', '2020-jan-01 00:00'):
+            with self.subTest(cd=cd):
+                self.assertEqual(cd_to_datetime(cd),
+                                 datetime.datetime.strptime(cd, CD_FORMAT))
+
+    def test_cd_to_datetime_rejects_malformed_dates(self):
+        for cd in ('2020-Jan-+1 00:00', '2020-Jan-01 00:0_0', '2020-Jan-٠١ 00:00',
+                   '20-Jan-01 00:00', '2020-Foo-01 00:00', '2020-Feb-30 00:00',
+                   '2020-Jan-01 24:00', '2020-Jan-01T00:00', '2020-Jan-01 00:00 ', ''):
+            with self.subTest(cd=cd):
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(cd)
+
+    def test_datetime_to_str_round_trip(self):
+        dt = cd_to_datetime('2020-Dec-31 12:00')
+        self.assertEqual(datetime_to_str(dt), '2020-12-31 12:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,13 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import operator
 import pathlib
 import unittest
 
 from database import NEODatabase
 from extract import load_neos, load_approaches
-from filters import create_filters
+from filters import create_filters, DateFilter
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -126,6 +127,56 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_with_a_date_filter_built_directly(self):
+        date = datetime.date(2020, 3, 2)
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.time.date() == date
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [DateFilter(operator.eq, date)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_a_specific_date_before_start_date(self):
+        date = datetime.date(2020, 3, 2)
+        start_date = datetime.date(2020, 3, 3)
+
+        expected = set()
+
+        filters = create_filters(date=date, start_date=start_date)
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_a_specific_date_after_end_date(self):
+        date = datetime.date(2020, 3, 2)
+        end_date = datetime.date(2020, 3, 1)
+
+        expected = set()
+
+        filters = create_filters(date=date, end_date=end_date)
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_date_bounds_keeps_input_order(self):
+        start_date = datetime.date(2020, 3, 1)
+        end_date = datetime.date(2020, 3, 31)
+
+        approaches = list(reversed(load_approaches(TEST_CAD_FILE)))
+        db = NEODatabase(load_neos(TEST_NEO_FILE), approaches)
+
+        expected = [
+            approach for approach in approaches
+            if start_date <= approach.time.date() <= end_date
+        ]
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(start_date=start_date, end_date=end_date)
+        received = list(db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results are not in input order.")
+
     def test_query_with_max_distance(self):
         distance_max = 0.4
 
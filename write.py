@@ -10,112 +10,64 @@ The file's extension determines which of these functions is used.
 """
 import csv
 import json
-import math
 
 
-class SupportedFormats:
-    """Encapsulate supported formatting."""
-
-    def __init__(self):
-        """Construct the object of `SupportedFormats` class."""
-        self.supported_formats = {'csv', 'json'}
-
-    def __str__(self):
-        """Return a string representation of `SupportedFormats` class."""
-        return self.supported_formats_str
-
-    @property
-    def supported_formats_str(self):
-        """Return string representation of supported formats."""
-        str_f = ''
-        for i, f in enumerate(self.supported_formats):
-            if i < len(self.supported_formats) - 1:
-                str_f += f"'{f}' ,"
-            else:
-                str_f += f"'{f}'"
-        return str_f
-
-
-def serialize(approaches, format):
-    """Prepare data to write to the file with proper formating.
+def _csv_rows(approaches):
+    """Generate CSV rows, in the order of the CSV header.
 
     :param approaches: An iterable of `CloseApproach` objects.
-    :param format: (str). Supported formating: 'csv', 'json'.
+    :yield: A tuple of values for each `CloseApproach`.
     """
-    sp = SupportedFormats()
-    sp.supported_formats = {'csv', 'json'}
-    assert \
-        format.lower() in sp.supported_formats, \
-        f"Unsupported format. Supported formats: {sp}"
-
-    result = []
-
-    def get_neo_model(app, format):
-        """Return an representation of `NEO` for specified file type.
-
-        param app: A `CloseApproach` objects.
-        param format: (str). Supported formating: 'csv', 'json'.
-        return dict: A model of NEO object represends specified format.
-        """
-        neo_model = {}
-
-        if format == 'csv':
-            neo_model = {
-                'neo': {
-                    'designation': app.neo.designation,
-                    'name': ''
-                            if app.neo.name is None else app.neo.name,
-                    'diameter_km': app.neo.diameter
-                            if not math.isnan(float(app.neo.diameter))
-                            else float('nan'),
-                    'potentially_hazardous': 'True'
-                            if app.neo.hazardous
-                            else 'False'
-                }
-            }
-
-        if format == 'json':
-            neo_model = {
-                'neo': {
-                    'designation': app.neo.designation,
-                    'name': ''
-                            if app.neo.name is None else app.neo.name,
-                    'diameter_km': app.neo.diameter
-                            if not math.isnan(float(app.neo.diameter))
-                            else float('nan'),
-                    'potentially_hazardous': app.neo.hazardous
-                }
-            }
+    for app in approaches:
+        neo = app.neo
+        yield (
+            app.time_str, app.distance, app.velocity,
+            neo.designation, '' if neo.name is None else neo.name,
+            neo.diameter, neo.hazardous
+        )
 
-        return neo_model
 
-    def get_ca_model(app):
-        """Return an representation of `CloseApproach`.
+def _json_rows(approaches):
+    """Return JSON records, a `CloseApproach` with its nested `NEO`.
 
-        param app: A `CloseApproach` objects.
-        return dict: A representation of `CloseApproach` object.
-        """
-        ca_model = {
+    :param approaches: An iterable of `CloseApproach` objects.
+    :return: A list of dicts, one for each `CloseApproach`.
+    """
+    return [
+        {
             'datetime_utc': app.time_str,
             'distance_au': app.distance,
             'velocity_km_s': app.velocity,
+            'neo': {
+                'designation': app.neo.designation,
+                'name': '' if app.neo.name is None else app.neo.name,
+                'diameter_km': app.neo.diameter,
+                'potentially_hazardous': app.neo.hazardous
             }
-        return ca_model
+        }
+        for app in approaches
+    ]
+
 
-    # Formatting for csv file
-    if format.lower() == 'csv':
-        for app in approaches:
+_SERIALIZERS = {'csv': _csv_rows, 'json': _json_rows}
+_SUPPORTED_FORMATS = frozenset(_SERIALIZERS)
 
-            row = {**get_neo_model(app, 'csv')['neo'], **get_ca_model(app)}
-            result.append(row)
 
-    # Formatting for json file
-    if format.lower() == 'json':
-        for app in approaches:
-            row = {**get_ca_model(app), **get_neo_model(app, 'json')}
-            result.append(row)
+def serialize(approaches, format):
+    """Prepare data to write to the file with proper formating.
+
+    CSV rows are generated lazily, so they can be streamed to the file;
+    JSON records are collected in a list, as the whole document is encoded
+    at once.
+
+    :param approaches: An iterable of `CloseApproach` objects.
+    :param format: (str). Supported formating: 'csv', 'json'.
+    """
+    assert \
+        format.lower() in _SUPPORTED_FORMATS, \
+        f"Unsupported format. Supported formats: {sorted(_SUPPORTED_FORMATS)}"
 
-    return result
+    return _SERIALIZERS[format.lower()](approaches)
 
 
 def write_to_csv(results, filename):
@@ -132,8 +84,8 @@ def write_to_csv(results, filename):
     res = serialize(results, 'csv')
 
     with open(filename, 'w', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(file)
+        writer.writerow(fieldnames)
         writer.writerows(res)
 
 